@@ -5,7 +5,7 @@ import json
 import os
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from backend import settings
 from backend.schemas.movies import MovieCreate, MovieOut, MovieUpdate
@@ -18,7 +18,7 @@ EXTERNAL_METADATA_DIR = os.getenv(
 )
 
 # Global Fields for consistent CSV header/order
-ALL_FIELDS = [
+ALL_FIELDS = (
     "movie_id",
     "title",
     "genre",
@@ -32,7 +32,9 @@ ALL_FIELDS = [
     "created_at",
     "updated_at",
     "review_count",
-]
+)
+
+_DATE_FIELDS = ("created_at", "updated_at")
 
 
 def _ensure_data_dir() -> None:
@@ -114,7 +116,7 @@ def _save_movies_to_csv(movies: List[Dict[str, Any]]) -> None:
         for m in movies:
             item = m.copy()
             # Convert datetime to ISO format string for saving
-            for d in ["created_at", "updated_at"]:
+            for d in _DATE_FIELDS:
                 if isinstance(item.get(d), datetime):
                     item[d] = item[d].isoformat()
             writer.writerow(item)
@@ -128,7 +130,7 @@ def _load_movies_from_json() -> List[Dict[str, Any]]:
         with open(MOVIES_JSON_PATH, "r", encoding="utf-8") as f:
             movies = json.load(f)
         for m in movies:
-            for d in ["created_at", "updated_at"]:
+            for d in _DATE_FIELDS:
                 m[d] = _parse_date_field(m.get(d))
         return movies
     except Exception:
@@ -140,7 +142,7 @@ def _save_movies_to_json(movies: List[Dict[str, Any]]) -> None:
     dump = []
     for m in movies:
         item = m.copy()
-        for d in ["created_at", "updated_at"]:
+        for d in _DATE_FIELDS:
             if isinstance(item.get(d), datetime):
                 item[d] = item[d].isoformat()
         dump.append(item)
@@ -153,7 +155,7 @@ def _movie_to_dict(movie: Dict[str, Any]) -> Dict[str, Any]:
     result = movie.copy()
     now = datetime.now(timezone.utc)
 
-    for d in ["created_at", "updated_at"]:
+    for d in _DATE_FIELDS:
         if not isinstance(result.get(d), datetime):
             result[d] = now
         elif result[d].tzinfo is None:
@@ -164,31 +166,106 @@ def _movie_to_dict(movie: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+# ---------------- Storage backends ---------------- #
+
+
+class MovieStorage(Protocol):
+    """Where MovieRepository reads and writes its raw movie dicts."""
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Return every stored movie as a raw dict."""
+
+    def save(self, movies: List[Dict[str, Any]]) -> None:
+        """Replace the stored movies with `movies`."""
+
+
+class CSVMovieStorage:
+    """Movies stored in the CSV file at MOVIES_CSV_PATH."""
+
+    def load(self) -> List[Dict[str, Any]]:
+        return _load_movies_from_csv()
+
+    def save(self, movies: List[Dict[str, Any]]) -> None:
+        _save_movies_to_csv(movies)
+
+
+class JSONMovieStorage:
+    """Movies stored in the JSON file at MOVIES_JSON_PATH."""
+
+    def load(self) -> List[Dict[str, Any]]:
+        return _load_movies_from_json()
+
+    def save(self, movies: List[Dict[str, Any]]) -> None:
+        _save_movies_to_json(movies)
+
+
+class InMemoryMovieStorage:
+    """Movies kept in a plain list; no file I/O (useful for tests)."""
+
+    def __init__(self, movies: Optional[List[Dict[str, Any]]] = None):
+        self.movies = [dict(m) for m in movies or []]
+
+    def load(self) -> List[Dict[str, Any]]:
+        # Hand out copies so a cache reset behaves like re-reading a file
+        return [dict(m) for m in self.movies]
+
+    def save(self, movies: List[Dict[str, Any]]) -> None:
+        self.movies = [dict(m) for m in movies]
+
+
 class MovieRepository:
     """Movie storage using CSV/JSON. Includes caching for performance."""
 
-    def __init__(self, use_json: bool = False):
-        self.use_json = use_json
+    def __init__(self, use_json: bool = False, storage: Optional[MovieStorage] = None):
+        if storage is None:
+            storage = JSONMovieStorage() if use_json else CSVMovieStorage()
+        self.storage = storage
+        # Describe the backend actually in use, not the (ignored) flag
+        self.use_json = isinstance(storage, JSONMovieStorage)
         self._cache: Optional[List[Dict[str, Any]]] = None  # In-memory data cache
 
+        # Lookup indexes derived from the cache (rebuilt when the cache changes)
+        self._index_source: Optional[List[Dict[str, Any]]] = None
+        self._by_title_lower: Dict[str, Dict[str, Any]] = {}
+        self._titles_lower: List[Tuple[str, Dict[str, Any]]] = []
+        self._by_rating: List[Dict[str, Any]] = []
+
     def _load_movies(self) -> List[Dict[str, Any]]:
         # Check cache first
         if self._cache is not None:
             return self._cache
 
-        # Load from file and set cache
-        movies = _load_movies_from_json() if self.use_json else _load_movies_from_csv()
-        self._cache = movies
+        # Load from storage and set cache
+        self._cache = self.storage.load()
         return self._cache
 
     def _save_movies(self, movies: List[Dict[str, Any]]) -> None:
-        # Update cache before writing to file
+        # Update cache before writing to storage
         self._cache = movies
-        return (
-            _save_movies_to_json(movies)
-            if self.use_json
-            else _save_movies_to_csv(movies)
+        self._index_source = None  # list may have been mutated in place
+        self.storage.save(movies)
+
+    def _build_indexes(self) -> None:
+        """Index the cached movies by lowercased title and by rating."""
+        movies = self._load_movies()
+        if self._index_source is movies:
+            return
+
+        by_title: Dict[str, Dict[str, Any]] = {}
+        titles: List[Tuple[str, Dict[str, Any]]] = []
+        for m in movies:
+            key = (m.get("title") or "").lower()
+            by_title.setdefault(key, m)  # first match wins, like a linear scan
+            titles.append((key, m))
+
+        self._by_title_lower = by_title
+        self._titles_lower = titles
+        self._by_rating = sorted(
+            (m for m in movies if m.get("rating") is not None),
+            key=lambda x: (x.get("rating", 0), x.get("title") or ""),
+            reverse=True,
         )
+        self._index_source = movies
 
     # ---------------- CRUD ---------------- #
 
@@ -203,8 +280,10 @@ class MovieRepository:
         total = len(movies)
 
         if sort_by:
-            # Sort handles None values by placing them first/last
-            movies.sort(
+            # Sort a copy so the cache (and its indexes) keep insertion order.
+            # None values are placed first/last
+            movies = sorted(
+                movies,
                 key=lambda x: (x.get(sort_by) is None, x.get(sort_by)),
                 reverse=sort_desc,
             )
@@ -219,10 +298,9 @@ class MovieRepository:
         return None
 
     def get_by_title(self, title: str) -> Optional[MovieOut]:
-        for m in self._load_movies():  # Loads from cache
-            if m.get("title", "").lower() == title.lower():
-                return MovieOut.model_validate(_movie_to_dict(m))
-        return None
+        self._build_indexes()
+        m = self._by_title_lower.get(title.lower())
+        return MovieOut.model_validate(_movie_to_dict(m)) if m else None
 
     def create(self, movie_create: MovieCreate) -> MovieOut:
         movies = self._load_movies()  # Loads from cache
@@ -268,25 +346,21 @@ class MovieRepository:
     # ---------------- Extra Queries ---------------- #
 
     def get_popular(self, limit: int = 10) -> List[MovieOut]:
-        movies = self._load_movies()
-        movies_with_rating = [m for m in movies if m.get("rating") is not None]
-        movies_with_rating.sort(
-            key=lambda x: (x.get("rating", 0), x.get("title") or ""), reverse=True
-        )
+        self._build_indexes()  # _by_rating is already sorted by rating desc
         return [
-            MovieOut.model_validate(_movie_to_dict(m))
-            for m in movies_with_rating[:limit]
+            MovieOut.model_validate(_movie_to_dict(m)) for m in self._by_rating[:limit]
         ]
 
     def get_recent(self, limit: int = 10) -> List[MovieOut]:
         movies = self._load_movies()
         # Use datetime.min as a fallback for missing created_at to ensure stable sort
-        movies.sort(
+        recent = sorted(
+            movies,
             key=lambda x: x.get("created_at")
             or datetime.min.replace(tzinfo=timezone.utc),
             reverse=True,
         )
-        return [MovieOut.model_validate(_movie_to_dict(m)) for m in movies[:limit]]
+        return [MovieOut.model_validate(_movie_to_dict(m)) for m in recent[:limit]]
 
     def search(
         self,
@@ -299,14 +373,16 @@ class MovieRepository:
         sort_desc: bool = False,
     ) -> tuple[list[MovieOut], int]:
         """Simple search filter for movies."""
-        movies = self._load_movies()
+        self._build_indexes()
+        needle = title.lower() if title else None
+        genre_needle = genre.lower() if genre else None
 
-        # Basic filtering
+        # Basic filtering over the prebuilt lowercased titles
         filtered = []
-        for m in movies:
-            if title and title.lower() not in (m.get("title") or "").lower():
+        for title_lower, m in self._titles_lower:
+            if needle and needle not in title_lower:
                 continue
-            if genre and genre.lower() not in (m.get("genre") or "").lower():
+            if genre_needle and genre_needle not in (m.get("genre") or "").lower():
                 continue
             if release_year and m.get("release_year") != release_year:
                 continue
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.deps import require_admin
 from backend.main import app
 from backend.repositories.users_repo import UserRepository
 from backend.services import auth_service
@@ -17,28 +18,64 @@ def client():
     return TestClient(app)
 
 
-# ---- Timestamp helper (global, not fixture) ----
+@pytest.fixture(autouse=True)
+def _reset_overrides():
+    """Restore app.dependency_overrides after each test (client is shared)."""
+    saved = dict(app.dependency_overrides)
+    yield
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved)
+
+
+# ---- Timestamp helpers (global, not fixtures) ----
+# Fixed created_at/updated_at for sample data that does not depend on wall time
+FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def now_iso():
     return datetime.now(timezone.utc).isoformat()
 
 
 # ---- JWT headers ----
-@pytest.fixture
-def jwt_user_headers():
-    token = auth_service.create_access_token(
-        {"sub": "u1", "role": "user", "username": "u1"},
+def _bearer_token(username: str, role: str) -> str:
+    return auth_service.create_access_token(
+        {"sub": username, "role": role, "username": username},
         expires_delta=timedelta(minutes=30),
     )
-    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session")
+def _user_token():
+    """Signed once per session; the payload and TTL never change."""
+    return _bearer_token("u1", "user")
+
+
+@pytest.fixture(scope="session")
+def _admin_token():
+    """Signed once per session; the payload and TTL never change."""
+    return _bearer_token("admin", "admin")
 
 
 @pytest.fixture
-def jwt_admin_headers():
-    token = auth_service.create_access_token(
-        {"sub": "admin", "role": "admin", "username": "admin"},
-        expires_delta=timedelta(minutes=30),
-    )
-    return {"Authorization": f"Bearer {token}"}
+def jwt_user_headers(_user_token):
+    # Fresh dict per test so a test adding headers cannot leak into others
+    return {"Authorization": f"Bearer {_user_token}"}
+
+
+@pytest.fixture
+def jwt_admin_headers(_admin_token):
+    return {"Authorization": f"Bearer {_admin_token}"}
+
+
+# ---- Admin dependency override (skips JWT encode/decode) ----
+@pytest.fixture
+def mock_current_admin():
+    app.dependency_overrides[require_admin] = lambda: {
+        "user_id": "admin",
+        "role": "admin",
+    }
+    yield
+    app.dependency_overrides.pop(require_admin, None)
 
 
 # ---- Token factory (for integration tests needing dynamic users) ----
@@ -76,8 +113,21 @@ def pytest_configure(config):
 
 
 def pytest_addoption(parser):
-    # placeholder to ensure pytest sees plugins/options consistently
-    pass
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration (they read the real backend/data)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-integration"):
+        return
+    skip = pytest.mark.skip(reason="integration test; pass --run-integration")
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(skip)
 
 
 @pytest.fixture
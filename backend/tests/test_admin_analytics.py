@@ -2,6 +2,9 @@ import pytest
 
 from backend.services import analytics_service
 
+# Reads the real review data; skipped unless --run-integration is given
+pytestmark = pytest.mark.integration
+
 
 def _assert_or_skip_for_empty_rows(rows, skip_message: str) -> None:
     """
@@ -11,7 +14,6 @@ def _assert_or_skip_for_empty_rows(rows, skip_message: str) -> None:
         pytest.skip(skip_message)
 
 
-@pytest.mark.integration
 def test_search_case_insensitive() -> None:
     """
     Searching by lowercase query should match titles regardless of case.
@@ -28,7 +30,6 @@ def test_search_case_insensitive() -> None:
         assert "avengers" in row["movie_title"].lower()
 
 
-@pytest.mark.integration
 def test_sort_by_rating_desc() -> None:
     """
     Sorting by rating descending should produce ratings from high → low.
@@ -42,7 +43,6 @@ def test_sort_by_rating_desc() -> None:
     assert ratings == sorted(ratings, reverse=True)
 
 
-@pytest.mark.integration
 def test_write_reviews_csv(tmp_path) -> None:
     """
     Writing review search results to CSV should produce a file
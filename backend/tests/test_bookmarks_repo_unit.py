@@ -5,7 +5,7 @@ This test uses tmp_path to avoid touching real files.
 
 import csv
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
@@ -14,6 +14,11 @@ import pytest
 from backend.repositories.bookmarks_repo import JSONBookmarkRepo
 from backend.schemas.bookmarks import BookmarkCreate
 
+from .conftest import FIXED_NOW
+
+# Timestamps as the repo stores them in bookmarks.json (ISO strings)
+_STORED_AT = FIXED_NOW.isoformat()
+
 
 def sample_bookmark(movie_id: str = "movie_67890") -> BookmarkCreate:
     """Helper to create a sample BookmarkCreate instance for testing."""
@@ -59,21 +64,20 @@ def test_create_duplicate_prevented(tmp_path, mocker):
 def test_list_all_bookmarks(tmp_path, mocker):
     repo = JSONBookmarkRepo(storage_path=str(tmp_path / "bookmarks.json"))
 
-    now = datetime.now(timezone.utc).isoformat()
     fake_data = [
         {
             "id": str(uuid.uuid4()),
             "user_id": "u1",
             "movie_id": "m1",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
         {
             "id": str(uuid.uuid4()),
             "user_id": "u2",
             "movie_id": "m2",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
     ]
     mocker.patch.object(repo, "_load", return_value=fake_data)
@@ -87,28 +91,27 @@ def test_list_all_bookmarks(tmp_path, mocker):
 def test_get_bookmarks_by_user(tmp_path, mocker):
     repo = JSONBookmarkRepo(storage_path=str(tmp_path / "bookmarks.json"))
 
-    now = datetime.now(timezone.utc).isoformat()
     fake_data = [
         {
             "id": str(uuid.uuid4()),
             "user_id": "u1",
             "movie_id": "m1",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
         {
             "id": str(uuid.uuid4()),
             "user_id": "u1",
             "movie_id": "m2",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
         {
             "id": str(uuid.uuid4()),
             "user_id": "u2",
             "movie_id": "m3",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
     ]
     mocker.patch.object(repo, "_load", return_value=fake_data)
@@ -120,29 +123,28 @@ def test_get_bookmarks_by_user(tmp_path, mocker):
 
 def test_get_bookmarks_by_movie(tmp_path, mocker):
     repo = JSONBookmarkRepo(storage_path=str(tmp_path / "bookmarks.json"))
-    now = datetime.now(timezone.utc).isoformat()
 
     fake_data = [
         {
             "id": str(uuid.uuid4()),
             "user_id": "u1",
             "movie_id": "m1",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
         {
             "id": str(uuid.uuid4()),
             "user_id": "u2",
             "movie_id": "m1",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
         {
             "id": str(uuid.uuid4()),
             "user_id": "u3",
             "movie_id": "m2",
-            "created_at": now,
-            "updated_at": now,
+            "created_at": _STORED_AT,
+            "updated_at": _STORED_AT,
         },
     ]
     mocker.patch.object(repo, "_load", return_value=fake_data)
@@ -4,10 +4,13 @@ Covers CRUD, persistence, caching, and data conversion.
 """
 
 import csv
+import io
 import json
-import os
-import tempfile
-from unittest.mock import MagicMock, patch
+import re
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -15,27 +18,38 @@ import pytest
 # FIX: Import the module-level function _load_movies_from_csv for correct mocking
 from backend.repositories.movies_repo import (
     ALL_FIELDS,
+    InMemoryMovieStorage,
     MovieRepository,
     _load_movies_from_csv,
+    _movie_to_dict,
+    _process_csv_row,
 )
 from backend.schemas.movies import MovieCreate, MovieUpdate
+from backend.tests.conftest import FIXED_NOW
 
-# --- Fixtures ---
+_RE_ALREADY_EXISTS = re.compile("already exists")
 
+# Header plus one row whose numeric and date cells are all unparseable
+_CORRUPT_CSV = (
+    b"movie_id,title,genre,release_year,rating,runtime,director,cast,plot,"
+    b"poster_url,created_at,updated_at,review_count\n"
+    b"corrupted,Corrupted Movie,Drama,not_a_number,bad,long,,,,,"
+    b"invalid_date,invalid_date,0\n"
+)
 
-@pytest.fixture
-def empty_temp_file():
-    """Provides a path to a temporary file that will be cleaned up."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        path = f.name
-    yield path
-    os.unlink(path)
 
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned; patched in place of the repo's name."""
 
-@pytest.fixture
-def populated_csv_data():
-    """Returns a list of dictionaries representing valid CSV rows."""
-    return [
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+
+# Sample rows shared by every CSV fixture (values as stored in the file).
+# Frozen: tests that need a variant build dict(row, **overrides).
+_CSV_ROWS = (
+    MappingProxyType(
         {
             'movie_id': 'tt0111161',
             'title': 'The Shawshank Redemption',
@@ -50,7 +64,9 @@ def populated_csv_data():
             'created_at': '2024-01-01T12:00:00Z',
             'updated_at': '2024-01-01T12:00:00Z',
             'review_count': '0',
-        },
+        }
+    ),
+    MappingProxyType(
         {
             'movie_id': 'tt0068646',
             'title': 'The Godfather',
@@ -65,71 +81,191 @@ def populated_csv_data():
             'created_at': '2024-01-01T13:00:00Z',
             'updated_at': '2024-01-01T13:00:00Z',
             'review_count': '10',
-        },
-    ]
+        }
+    ),
+)
+
+
+def _render_csv(rows):
+    """Header plus rows as CSV text, written by csv.DictWriter."""
+    buf = io.StringIO()
+    # Use ALL_FIELDS to ensure consistent header writing
+    writer = csv.DictWriter(buf, fieldnames=ALL_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+# _CSV_ROWS as file text, rendered once at import
+_CSV_BLOB = _render_csv(_CSV_ROWS)
+
+# Sample payload for the JSON-backed repo
+_JSON_ROWS = (
+    {
+        'movie_id': 'tt0068646',
+        'title': 'The Godfather',
+        'genre': 'Crime, Drama',
+        'release_year': 1972,
+        'rating': 9.2,
+        'runtime': 175,
+    },
+)
+
+# Serialized once at import; the payload never changes between tests
+_JSON_TEXT = json.dumps(_JSON_ROWS)
+
+# Prebuilt (validated once at import) inputs for the field round-trip tests
+RATING_CASES = [
+    pytest.param(MovieCreate(title="Rating Test Movie", rating=r), id=f"rating-{r}")
+    for r in (0.0, 0.1, 5.0, 7.5, 9.9, 10.0, None)
+]
+RELEASE_YEAR_CASES = [
+    pytest.param(MovieCreate(title="Year Test Movie", release_year=y), id=f"year-{y}")
+    for y in (1888, 1994, 2024, None)
+]
+
+# Ids seeded into populated_repo_5, formatted once for seeding and asserts
+_REPO_5_IDS = tuple(f"m{i}" for i in range(5))
+
+# --- Fixtures ---
 
 
 @pytest.fixture
-def temp_csv_file(empty_temp_file, populated_csv_data):
-    """Creates a temporary CSV file populated with two movies."""
-    with open(empty_temp_file, 'w', encoding='utf-8', newline='') as f:
-        # Use ALL_FIELDS to ensure consistent header writing
-        writer = csv.DictWriter(f, fieldnames=ALL_FIELDS)
-        writer.writeheader()
+def empty_temp_file(tmp_path):
+    """Provides a path inside pytest's tmp_path (cleaned up by pytest)."""
+    path = tmp_path / "movies.csv"
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def populated_csv_data():
+    """The valid CSV rows as read-only mappings (shared, never copied)."""
+    return _CSV_ROWS
+
 
-        # We only pass data that matches the keys defined in populated_csv_data
-        writer.writerows(populated_csv_data)
+@pytest.fixture(scope="session")
+def csv_template(tmp_path_factory):
+    """Writes the populated CSV once per session; tests copy it."""
+    path = tmp_path_factory.mktemp("movies_template") / "movies.csv"
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(_CSV_BLOB)
+    return path
 
+
+@pytest.fixture
+def temp_csv_file(empty_temp_file, csv_template):
+    """Creates a temporary CSV file populated with two movies."""
+    shutil.copyfile(csv_template, empty_temp_file)
     return empty_temp_file
 
 
 @pytest.fixture
-def temp_json_file(empty_temp_file):
-    """Creates a temporary JSON file populated with one movie."""
-    data = [
-        {
-            'movie_id': 'tt0068646',
-            'title': 'The Godfather',
-            'genre': 'Crime, Drama',
-            'release_year': 1972,
-            'rating': 9.2,
-            'runtime': 175,
-        }
-    ]
-    with open(empty_temp_file, 'w') as f:
-        json.dump(data, f)
+def repo_paths(monkeypatch, tmp_path):
+    """Points movies_repo's data dir at tmp_path so saves never leave it."""
+    monkeypatch.setattr(
+        'backend.repositories.movies_repo.EXTERNAL_METADATA_DIR',
+        str(tmp_path / "external"),
+    )
+    return tmp_path
 
-    return empty_temp_file
+
+@pytest.fixture
+def csv_repo_rw(monkeypatch, repo_paths, temp_csv_file):
+    """Patches MOVIES_CSV_PATH to a temp copy of the template; returns a CSV repo."""
+    monkeypatch.setattr(
+        'backend.repositories.movies_repo.MOVIES_CSV_PATH', temp_csv_file
+    )
+    return MovieRepository(use_json=False)
+
+
+@pytest.fixture(scope="session")
+def _parsed_movies(csv_template):
+    """The template CSV parsed once per session (read-only rows)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            'backend.repositories.movies_repo.MOVIES_CSV_PATH', str(csv_template)
+        )
+        return tuple(_load_movies_from_csv())
 
 
 @pytest.fixture
-def csv_repo(temp_csv_file):
-    """Patches MOVIES_CSV_PATH and returns an initialized CSV repo."""
-    with patch('backend.repositories.movies_repo.MOVIES_CSV_PATH', temp_csv_file):
-        repo = MovieRepository(use_json=False)
-        # Clear the cache before running the test to ensure fresh load
-        repo._cache = None
-        yield repo
+def csv_repo_ro(_parsed_movies):
+    """Repo over the parsed template CSV, held in memory (fresh copy per test)."""
+    return MovieRepository(storage=InMemoryMovieStorage(list(_parsed_movies)))
+
+
+@pytest.fixture(scope="module")
+def populated_repo_5():
+    """Module-wide in-memory repo seeded with five movies (read-only)."""
+    repo = MovieRepository(storage=InMemoryMovieStorage())
+    for movie_id in _REPO_5_IDS:
+        repo.create(MovieCreate(movie_id=movie_id, title=f"Movie {movie_id}"))
+    return repo
+
+
+@pytest.fixture
+def json_repo(monkeypatch, repo_paths):
+    """Patches MOVIES_JSON_PATH to a temp file and returns a JSON repo."""
+    path = repo_paths / "movies.json"
+    path.write_text(_JSON_TEXT, encoding='utf-8')
+    monkeypatch.setattr('backend.repositories.movies_repo.MOVIES_JSON_PATH', str(path))
+    return MovieRepository(use_json=True)
 
 
 @pytest.fixture
-def json_repo(temp_json_file):
-    """Patches MOVIES_JSON_PATH and returns an initialized JSON repo."""
-    with patch('backend.repositories.movies_repo.MOVIES_JSON_PATH', temp_json_file):
-        repo = MovieRepository(use_json=True)
-        repo._cache = None
-        yield repo
+def mem_repo(populated_csv_data):
+    """Repo over in-memory storage for logic-only tests (no file I/O)."""
+    rows = [_process_csv_row(row) for row in populated_csv_data]
+    return MovieRepository(storage=InMemoryMovieStorage(rows))
+
+
+@pytest.fixture
+def mock_only_repo(monkeypatch):
+    """Repo whose load is stubbed out; tests patch _save_movies themselves."""
+    monkeypatch.setattr(MovieRepository, "_load_movies", lambda self: [])
+    return MovieRepository(use_json=False)
 
 
 # --- Tests ---
 
 
+class TestMovieDictHelpers:
+    """Pure helper functions; no repository or temp files involved."""
+
+    def test_movie_to_dict_fills_missing_timestamps(self, monkeypatch):
+        """Tests that missing timestamps default to now and review_count to 0."""
+        monkeypatch.setattr(
+            'backend.repositories.movies_repo.datetime', _FrozenDatetime
+        )
+        movie_dict = _movie_to_dict({'title': 'Mocked Time Movie'})
+        assert movie_dict['created_at'] == FIXED_NOW
+        assert movie_dict['updated_at'] == FIXED_NOW
+        assert movie_dict['review_count'] == 0
+
+    def test_movie_to_dict_naive_timestamps_become_utc(self):
+        """Tests that naive timestamps are tagged as UTC, not shifted."""
+        naive = datetime(2024, 1, 1, 12, 0)
+        movie_dict = _movie_to_dict({'created_at': naive, 'updated_at': naive})
+        assert movie_dict['created_at'] == naive.replace(tzinfo=timezone.utc)
+        assert movie_dict['updated_at'].tzinfo is timezone.utc
+
+    def test_process_csv_row_empty_strings_to_none(self):
+        """Tests that empty CSV cells become None and numbers are parsed."""
+        row = dict(_CSV_ROWS[0], genre='', rating='', runtime='')
+        movie = _process_csv_row(row)
+        assert movie['genre'] is None
+        assert movie['rating'] is None
+        assert movie['runtime'] is None
+        assert movie['release_year'] == 1994
+
+
 class TestMovieRepositoryFunctional:
     """Tests CRUD and persistence functions."""
 
-    def test_initial_load(self, csv_repo):
+    def test_initial_load(self, csv_repo_ro):
         """Tests that the repository loads two movies correctly."""
-        movies, total = csv_repo.get_all()
+        movies, total = csv_repo_ro.get_all()
         assert total == 2
         assert movies[0].movie_id == 'tt0111161'
         assert movies[1].title == 'The Godfather'
@@ -145,133 +281,247 @@ class TestMovieRepositoryFunctional:
         assert total == 1
         assert movies[0].movie_id == 'tt0068646'
 
-    def test_get_by_id_existing(self, csv_repo):
+    def test_use_json_follows_storage(self, json_repo, mem_repo):
+        """Tests that use_json describes the storage in use, not the flag."""
+        assert json_repo.use_json is True
+        assert mem_repo.use_json is False
+        assert (
+            MovieRepository(use_json=True, storage=mem_repo.storage).use_json is False
+        )
+
+    def test_get_by_id_existing(self, csv_repo_ro):
         """Tests retrieval of an existing movie."""
-        movie = csv_repo.get_by_id('tt0111161')
+        movie = csv_repo_ro.get_by_id('tt0111161')
         assert movie is not None
         assert movie.title == 'The Shawshank Redemption'
 
-    def test_get_by_id_nonexistent(self, csv_repo):
+    def test_get_by_id_nonexistent(self, mem_repo):
         """Tests retrieval of a nonexistent movie returns None."""
-        assert csv_repo.get_by_id('does_not_exist') is None
+        assert mem_repo.get_by_id('does_not_exist') is None
 
-    def test_create_movie_new_id_persistence(self, csv_repo):
+    def test_create_movie_new_id_persistence(self, csv_repo_rw):
         """Tests creation and subsequent persistence to file."""
-        initial_count = csv_repo.get_all()[1]
+        initial_count = csv_repo_rw.get_all()[1]
 
         # 1. Create with no ID
-        new_movie = csv_repo.create(
+        new_movie = csv_repo_rw.create(
             MovieCreate(title="The Test Movie", genre="Sci-Fi", release_year=2024)
         )
 
         # 2. Check in memory (cache)
         assert new_movie.movie_id
-        assert csv_repo.get_by_id(new_movie.movie_id).title == "The Test Movie"
-        assert csv_repo.get_all()[1] == initial_count + 1
+        assert csv_repo_rw.get_by_id(new_movie.movie_id).title == "The Test Movie"
+        assert csv_repo_rw.get_all()[1] == initial_count + 1
 
         # 3. Simulate new repo load (to test persistence)
-        csv_repo._cache = None
-        persisted_movie = csv_repo.get_by_id(new_movie.movie_id)
+        csv_repo_rw._cache = None
+        persisted_movie = csv_repo_rw.get_by_id(new_movie.movie_id)
         assert persisted_movie.title == "The Test Movie"
-        assert csv_repo.get_all()[1] == initial_count + 1
+        assert csv_repo_rw.get_all()[1] == initial_count + 1
 
-    def test_update_movie_persistence(self, csv_repo):
+    def test_create_movie_generates_uuid(self, csv_repo_rw, monkeypatch):
+        """Tests that a missing movie_id is filled from uuid.uuid4()."""
+        fixed_uuid = "00000000-0000-4000-8000-000000000001"
+        monkeypatch.setattr(
+            "backend.repositories.movies_repo.uuid.uuid4", lambda: fixed_uuid
+        )
+
+        new_movie = csv_repo_rw.create(MovieCreate(title="UUID Movie"))
+        assert new_movie.movie_id == fixed_uuid
+        assert csv_repo_rw.get_by_id(fixed_uuid).title == "UUID Movie"
+
+    def test_update_movie_persistence(self, csv_repo_rw):
         """Tests update and subsequent persistence to file."""
         # Update
-        updated = csv_repo.update(
+        updated = csv_repo_rw.update(
             'tt0111161', MovieUpdate(title="Updated Name", rating=10.0)
         )
         assert updated and updated.title == "Updated Name"
         assert updated.rating == 10.0
 
         # Simulate new repo load (to test persistence)
-        csv_repo._cache = None
-        reloaded = csv_repo.get_by_id('tt0111161')
+        csv_repo_rw._cache = None
+        reloaded = csv_repo_rw.get_by_id('tt0111161')
         assert reloaded.title == "Updated Name"
         assert reloaded.rating == 10.0
 
-    def test_update_nonexistent(self, csv_repo):
+    @pytest.mark.parametrize("movie_create", RATING_CASES)
+    def test_create_rating_round_trip(self, mem_repo, movie_create):
+        """Tests that ratings (including None) survive create()."""
+        movie = mem_repo.create(movie_create)
+        assert movie.rating == movie_create.rating
+
+    @pytest.mark.parametrize("movie_create", RELEASE_YEAR_CASES)
+    def test_create_release_year_round_trip(self, mem_repo, movie_create):
+        """Tests that release years (including None) survive create()."""
+        movie = mem_repo.create(movie_create)
+        assert movie.release_year == movie_create.release_year
+
+    def test_update_nonexistent(self, mem_repo):
         """Tests updating a nonexistent movie."""
-        assert csv_repo.update("bad_id", MovieUpdate(title="X")) is None
+        assert mem_repo.update("bad_id", MovieUpdate(title="X")) is None
 
-    def test_delete_movie_persistence(self, csv_repo):
+    def test_delete_movie_persistence(self, csv_repo_rw):
         """Tests deletion and subsequent persistence to file."""
-        initial_count = csv_repo.get_all()[1]
+        initial_count = csv_repo_rw.get_all()[1]
 
         # 1. Delete
-        assert csv_repo.delete("tt0111161") is True
-        assert csv_repo.get_by_id("tt0111161") is None
-        assert csv_repo.get_all()[1] == initial_count - 1
+        assert csv_repo_rw.delete("tt0111161") is True
+        movies, total = csv_repo_rw.get_all()
+        assert total == initial_count - 1
+        assert all(m.movie_id != "tt0111161" for m in movies)
 
         # 2. Simulate new repo load (to test persistence)
-        csv_repo._cache = None
-        assert csv_repo.get_by_id("tt0111161") is None
-        assert csv_repo.get_all()[1] == initial_count - 1
+        csv_repo_rw._cache = None
+        movies, total = csv_repo_rw.get_all()
+        assert total == initial_count - 1
+        assert all(m.movie_id != "tt0111161" for m in movies)
 
-    def test_delete_nonexistent(self, csv_repo):
+    def test_delete_nonexistent(self, mem_repo):
         """Tests deleting a nonexistent movie."""
-        assert csv_repo.delete("bad_id") is False
+        assert mem_repo.delete("bad_id") is False
 
 
 class TestMovieRepositoryAdvanced:
     """Tests caching, sorting, pagination, and data robustness."""
 
-    def test_caching_mechanism(self, temp_csv_file):
+    def test_caching_mechanism(self, temp_csv_file, repo_paths, monkeypatch):
         """Ensures the repository uses the cache and avoids re-reading the file."""
+        monkeypatch.setattr(
+            'backend.repositories.movies_repo.MOVIES_CSV_PATH', temp_csv_file
+        )
+
+        # A plain counter is all we need; no MagicMock call bookkeeping
+        calls = [0]
 
-        # FIX: The mock wraps the module function directly
-        mock_load = MagicMock(wraps=_load_movies_from_csv)
+        def counting_load():
+            calls[0] += 1
+            return _load_movies_from_csv()
 
         # Patch targets the function's location within the module
-        with patch('backend.repositories.movies_repo._load_movies_from_csv', mock_load):
-            repo = MovieRepository(use_json=False)
+        monkeypatch.setattr(
+            'backend.repositories.movies_repo._load_movies_from_csv', counting_load
+        )
+        repo = MovieRepository(use_json=False)
 
-            # First call loads file
-            repo.get_all()
-            mock_load.assert_called_once()
+        # First call loads file
+        repo.get_all()
+        assert calls[0] == 1
 
-            # Second call should use cache, mock_load should not be called again
-            repo.get_by_id('tt0111161')
-            mock_load.assert_called_once()
+        # Second call should use cache, the file should not be read again
+        repo.get_by_id('tt0111161')
+        assert calls[0] == 1
 
-            # Create/Update/Delete should refresh the cache
-            repo.create(MovieCreate(title="Test Cache", release_year=2024))
+        # Create/Update/Delete should refresh the cache
+        repo.create(MovieCreate(title="Test Cache", release_year=2024))
 
-            # Third call should now hit the cache again
-            repo.get_all()
-            mock_load.assert_called_once()
+        # Third call should now hit the cache again
+        repo.get_all()
+        assert calls[0] == 1
 
-    def test_create_duplicate_id_raises_error(self, csv_repo):
+    def test_mock_file_operations(self, mock_only_repo, mocker):
+        """Ensures create() hands the new row to _save_movies."""
+        saved = []
+        mocker.patch.object(mock_only_repo, "_save_movies", side_effect=saved.extend)
+
+        created = mock_only_repo.create(MovieCreate(movie_id="tt9", title="Mocked"))
+        assert created.movie_id == "tt9"
+        assert [m["movie_id"] for m in saved] == ["tt9"]
+
+    def test_corrupted_csv_file_handling(self, empty_temp_file, monkeypatch):
+        """Unparseable numeric cells load as None; bad dates get an aware time."""
+        Path(empty_temp_file).write_bytes(_CORRUPT_CSV)
+        monkeypatch.setattr(
+            'backend.repositories.movies_repo.MOVIES_CSV_PATH', empty_temp_file
+        )
+        (movie,), total = MovieRepository(use_json=False).get_all()
+        assert total == 1
+        assert movie.movie_id == 'corrupted'
+        assert movie.release_year is None
+        assert movie.rating is None
+        assert movie.runtime is None
+        # Unparseable dates fall back to "now" rather than failing the load
+        assert movie.created_at.tzinfo is not None
+
+    def test_create_duplicate_id_raises_error(self, mem_repo):
         """Ensures creating a movie with an existing ID raises ValueError."""
-        with pytest.raises(ValueError, match="already exists"):
-            csv_repo.create(MovieCreate(movie_id="tt0111161", title="Duplicate Movie"))
+        with pytest.raises(ValueError, match=_RE_ALREADY_EXISTS):
+            mem_repo.create(MovieCreate(movie_id="tt0111161", title="Duplicate Movie"))
 
-    def test_get_all_sort_desc(self, csv_repo):
+    def test_get_all_sort_desc(self, csv_repo_ro):
         """Tests sorting by rating in descending order."""
-        movies, _ = csv_repo.get_all(sort_by='rating', sort_desc=True)
+        movies, _ = csv_repo_ro.get_all(sort_by='rating', sort_desc=True)
         # tt0111161 (9.3) should be first, tt0068646 (9.2) second
         assert movies[0].movie_id == 'tt0111161'
         assert movies[1].movie_id == 'tt0068646'
 
-    def test_get_all_pagination(self, csv_repo):
+    def test_get_all_pagination(self, csv_repo_ro):
         """Tests skip and limit parameters."""
         # Get one movie starting from the second one (index 1)
-        movies, total = csv_repo.get_all(skip=1, limit=1)
+        movies, total = csv_repo_ro.get_all(skip=1, limit=1)
         assert total == 2
         assert len(movies) == 1
         assert movies[0].movie_id == 'tt0068646'
 
-    def test_get_popular(self, csv_repo):
+    @pytest.mark.parametrize(
+        "skip,limit,expected",
+        [
+            (0, 2, 2),
+            (2, 2, 2),
+            (4, 2, 1),
+            (5, 2, 0),
+            (0, 10, 5),
+            (0, 0, 0),
+            (1, 3, 3),
+            (3, 5, 2),
+        ],
+    )
+    def test_pagination_combined(self, populated_repo_5, skip, limit, expected):
+        """Tests skip/limit combinations against a fixed five-movie repo."""
+        movies, total = populated_repo_5.get_all(skip=skip, limit=limit)
+        assert total == 5
+        assert [m.movie_id for m in movies] == list(_REPO_5_IDS[skip : skip + limit])
+        assert len(movies) == expected
+
+    def test_get_popular(self, csv_repo_ro):
         """Tests sorting by popularity (rating)."""
         # Data already sorted by rating desc: tt0111161 (9.3) then tt0068646 (9.2)
-        popular = csv_repo.get_popular(limit=1)
+        popular = csv_repo_ro.get_popular(limit=1)
         assert len(popular) == 1
         assert popular[0].movie_id == 'tt0111161'
 
-    def test_get_recent(self, csv_repo):
+    def test_search_by_title(self, mem_repo):
+        """Tests case-insensitive substring search on title."""
+        movies, total = mem_repo.search(title="GODFATHER")
+        assert total == 1
+        assert movies[0].movie_id == 'tt0068646'
+
+    def test_get_by_title(self, mem_repo):
+        """Tests exact, case-insensitive title lookup."""
+        assert mem_repo.get_by_title('the shawshank redemption').movie_id == (
+            'tt0111161'
+        )
+        assert mem_repo.get_by_title('Shawshank') is None
+
+    def test_indexes_follow_mutations(self, mem_repo):
+        """Ensures title/rating indexes are refreshed on create/update/delete."""
+        mem_repo.create(MovieCreate(movie_id="tt1", title="Top Rated", rating=9.9))
+        assert mem_repo.get_popular(limit=1)[0].movie_id == "tt1"
+        assert mem_repo.get_by_title("top rated").movie_id == "tt1"
+
+        mem_repo.update("tt1", MovieUpdate(title="Renamed", rating=1.0))
+        assert mem_repo.get_by_title("top rated") is None
+        assert mem_repo.search(title="renamed")[1] == 1
+        assert mem_repo.get_popular(limit=1)[0].movie_id == 'tt0111161'
+
+        mem_repo.delete("tt1")
+        assert mem_repo.get_by_title("renamed") is None
+        assert len(mem_repo.get_popular()) == 2
+
+    def test_get_recent(self, csv_repo_ro):
         """Tests sorting by creation date (recent)."""
         # Data created_at: tt0111161 (12:00) then tt0068646 (13:00)
         # Recent should be the one created later (tt0068646)
-        recent = csv_repo.get_recent(limit=1)
+        recent = csv_repo_ro.get_recent(limit=1)
         assert len(recent) == 1
         assert recent[0].movie_id == 'tt0068646'
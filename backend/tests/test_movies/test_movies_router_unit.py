@@ -1,44 +1,45 @@
 """
-Integration-style unit tests for Movies Router (JWT version).
-Covers CRUD + search + pagination + auth behavior.
+Integration-style unit tests for Movies Router.
+Covers CRUD + search + pagination against the real repository.
+Role gating is exercised in test_movies_router_integration.py.
 """
 
-from fastapi.testclient import TestClient
+import pytest
 
-from backend.main import app
+# Writes the real backend/data files; keep on one xdist worker (loadgroup)
+pytestmark = pytest.mark.xdist_group("real_data")
 
-client = TestClient(app)
+# Request bodies pre-serialized once; sent with an explicit content-type
+_JSON_CT = {"content-type": "application/json"}
+_CREATE_BODY = b'{"title": "A Movie"}'
+_UPDATE_BODY = b'{"rating": 9.0}'
 
 
 # ----- CRUD flow -----
-def test_full_movie_crud_flow(jwt_admin_headers):
+def test_full_movie_crud_flow(client, mock_current_admin):
     """Full admin CRUD lifecycle."""
     # Create
-    r = client.post(
-        "/api/movies/", json={"title": "A Movie"}, headers=jwt_admin_headers
-    )
+    r = client.post("/api/movies/", content=_CREATE_BODY, headers=_JSON_CT)
     assert r.status_code == 201
     mid = r.json()["movie_id"]
 
     # Get
-    r = client.get(f"/api/movies/{mid}", headers=jwt_admin_headers)
+    r = client.get(f"/api/movies/{mid}")
     assert r.status_code == 200
     assert r.json()["title"] == "A Movie"
 
     # Update
-    r = client.patch(
-        f"/api/movies/{mid}", json={"rating": 9.0}, headers=jwt_admin_headers
-    )
+    r = client.patch(f"/api/movies/{mid}", content=_UPDATE_BODY, headers=_JSON_CT)
     assert r.status_code == 200
     assert r.json()["rating"] == 9.0
 
     # Delete
-    r = client.delete(f"/api/movies/{mid}", headers=jwt_admin_headers)
+    r = client.delete(f"/api/movies/{mid}")
     assert r.status_code == 204
 
 
 # ----- Pagination & Search -----
-def test_list_movies_pagination():
+def test_list_movies_pagination(client):
     """GET /api/movies basic pagination."""
     r = client.get("/api/movies?page=1&page_size=20")
     assert r.status_code == 200
@@ -46,7 +47,7 @@ def test_list_movies_pagination():
     assert "items" in data and "total_pages" in data
 
 
-def test_search_movies_basic():
+def test_search_movies_basic(client):
     """GET /api/movies/search query."""
     r = client.get("/api/movies/search?title=shawshank")
     assert r.status_code == 200
@@ -56,7 +57,7 @@ def test_search_movies_basic():
 
 
 # ----- Popular & Recent -----
-def test_popular_and_recent_movies():
+def test_popular_and_recent_movies(client):
     """GET /popular and /recent endpoints."""
     r1 = client.get("/api/movies/popular")
     r2 = client.get("/api/movies/recent")
@@ -64,25 +65,9 @@ def test_popular_and_recent_movies():
     assert r2.status_code == 200
 
 
-# ----- Auth Protection -----
-def test_non_admin_cannot_create_update_delete(jwt_user_headers):
-    """Normal users forbidden from admin operations."""
-    endpoints = [
-        ("post", "/api/movies/", {"title": "Forbidden"}),
-        ("patch", "/api/movies/tt0001", {"rating": 5}),
-        ("delete", "/api/movies/tt0001", None),
-    ]
-    for method, url, payload in endpoints:
-        if method == "delete":
-            res = getattr(client, method)(url, headers=jwt_user_headers)
-        else:
-            res = getattr(client, method)(url, json=payload, headers=jwt_user_headers)
-        assert res.status_code == 403
-
-
 # ----- Validation -----
-def test_create_invalid_data(jwt_admin_headers):
+def test_create_invalid_data(client, mock_current_admin):
     """Invalid movie data triggers 422 or 400."""
     bad_payload = {"title": "   "}
-    r = client.post("/api/movies/", json=bad_payload, headers=jwt_admin_headers)
+    r = client.post("/api/movies/", json=bad_payload)
     assert r.status_code in (400, 422)
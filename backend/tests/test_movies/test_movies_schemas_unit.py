@@ -2,7 +2,7 @@
 Minimal but complete tests for movie schemas.
 """
 
-from datetime import datetime, timezone
+import json
 
 import pytest
 from pydantic import ValidationError
@@ -15,6 +15,33 @@ from backend.schemas.movies import (
     MovieSearchFilters,
     MovieUpdate,
 )
+from backend.tests.conftest import FIXED_NOW
+
+
+def _iso(value):
+    return value.isoformat()
+
+
+# ---------- Rejections (all schemas) ----------
+
+
+@pytest.mark.parametrize(
+    "model,data",
+    [
+        pytest.param(MovieBase, {"title": "   "}, id="base-blank-title"),
+        pytest.param(MovieBase, {"title": ""}, id="base-empty-title"),
+        pytest.param(MovieUpdate, {}, id="update-no-fields"),
+        pytest.param(
+            MovieOut,
+            {"title": "T", "created_at": FIXED_NOW, "updated_at": FIXED_NOW},
+            id="out-missing-id",
+        ),
+    ],
+)
+def test_schema_rejects(model, data):
+    with pytest.raises(ValidationError):
+        model.model_validate(data)
+
 
 # ---------- MovieBase ----------
 
@@ -24,11 +51,6 @@ def test_movie_base_normalizes_title():
     assert movie.title == "Test"
 
 
-def test_movie_base_rejects_empty_title():
-    with pytest.raises(ValidationError):
-        MovieBase(title="   ")
-
-
 # ---------- MovieCreate ----------
 
 
@@ -43,11 +65,6 @@ def test_movie_create_id_normalizes():
 # ---------- MovieUpdate ----------
 
 
-def test_movie_update_requires_at_least_one():
-    with pytest.raises(ValidationError):
-        MovieUpdate()
-
-
 def test_movie_update_valid_partial():
     m = MovieUpdate(genre="  Drama  ")
     assert m.genre == "Drama"
@@ -56,18 +73,21 @@ def test_movie_update_valid_partial():
 # ---------- MovieOut ----------
 
 
-def test_movie_out_fields():
-    now = datetime.now(timezone.utc)
-    out = MovieOut(
-        movie_id="id",
-        title="Test",
-        created_at=now,
-        updated_at=now,
-    )
+@pytest.mark.parametrize("mode", ["python", "json"])
+def test_movie_out_fields(mode):
+    data = {
+        "movie_id": "id",
+        "title": "Test",
+        "created_at": FIXED_NOW,
+        "updated_at": FIXED_NOW,
+    }
+    if mode == "json":
+        # pydantic-core parses and validates the raw JSON in one pass
+        out = MovieOut.model_validate_json(json.dumps(data, default=_iso))
+    else:
+        out = MovieOut(**data)
     assert out.review_count == 0
-
-    with pytest.raises(ValidationError):
-        MovieOut(title="T", created_at=now, updated_at=now)
+    assert out.created_at == FIXED_NOW
 
 
 # ---------- MovieSearchFilters ----------
@@ -83,8 +103,10 @@ def test_search_filters_strip_text_fields():
 
 
 def test_movie_list_response_basic():
-    now = datetime.now(timezone.utc)
-    item = MovieOut(movie_id="tt", title="T", created_at=now, updated_at=now)
+    # The item itself is not under test here; skip its validation
+    item = MovieOut.model_construct(
+        movie_id="tt", title="T", created_at=FIXED_NOW, updated_at=FIXED_NOW
+    )
     r = MovieListResponse(items=[item], total=1, page=1, page_size=10, total_pages=1)
     assert r.total == 1
     assert r.page == 1
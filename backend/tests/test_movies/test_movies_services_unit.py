@@ -2,12 +2,12 @@
 Unit tests for Movies Service (aligned with simplified repo)
 """
 
-from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 from fastapi import HTTPException
 
+from backend.repositories.movies_repo import MovieRepository
 from backend.schemas.movies import (
     MovieCreate,
     MovieListResponse,
@@ -26,21 +26,53 @@ from backend.services.movies_service import (
     search_movies,
     update_movie,
 )
+from backend.tests.conftest import FIXED_NOW
+
+# Out-of-range inputs, checked in one loop per test (cheap, no per-row setup)
+_INVALID_PAGINATION = ((0, 10), (1, 0), (1, 201))
+_INVALID_LIMITS = (0, 51)
+
+
+def _stats_movie(movie_id, genre, rating, release_year):
+    """Trusted sample row; model_construct skips validation (covered elsewhere)."""
+    return MovieOut.model_construct(
+        movie_id=movie_id,
+        title=movie_id,
+        genre=genre,
+        rating=rating,
+        release_year=release_year,
+        runtime=90,
+        created_at=FIXED_NOW,
+        updated_at=FIXED_NOW,
+    )
 
 
-@pytest.fixture
-def mock_repo():
-    """Mock MovieRepository."""
-    mock = MagicMock()
-    mock.search = MagicMock()
-    mock.get_all.return_value = ([], 0)
-    return mock
+# Built once at import for test_get_movie_stats
+_STATS_MOVIES = (
+    _stats_movie("1", "Drama, Comedy", 10.0, 2000),
+    _stats_movie("2", "Drama", 8.0, 2000),
+    _stats_movie("3", "Action", 6.0, 2024),
+)
+
+
+@pytest.fixture(scope="module")
+def _shared_repo_mock():
+    """Mock MovieRepository (spec only: attribute guard, no signature walk)."""
+    return MagicMock(spec=MovieRepository)
 
 
 @pytest.fixture
+def mock_repo(_shared_repo_mock):
+    """The module's repo mock, reset (calls, return values, side effects)."""
+    _shared_repo_mock.reset_mock(return_value=True, side_effect=True)
+    _shared_repo_mock.get_all.return_value = ([], 0)
+    return _shared_repo_mock
+
+
+@pytest.fixture(scope="session")
 def sample_movie_out():
-    """Sample MovieOut."""
-    return MovieOut(
+    """Sample MovieOut (trusted, unvalidated; tests derive changes via model_copy)."""
+    return MovieOut.model_construct(
         movie_id="tt011",
         title="Sample Movie",
         genre="Action",
@@ -51,8 +83,8 @@ def sample_movie_out():
         cast="Actor Y",
         plot="A plot.",
         poster_url="url",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=FIXED_NOW,
+        updated_at=FIXED_NOW,
         review_count=5,
     )
 
@@ -70,10 +102,10 @@ class TestMoviesServiceUnit:
         assert res.page == 2
         assert res.page_size == 50
 
-    @pytest.mark.parametrize("page,page_size", [(0, 10), (1, 0), (1, 201)])
-    def test_get_movies_invalid_pagination(self, mock_repo, page, page_size):
-        with pytest.raises(HTTPException):
-            get_movies(page=page, page_size=page_size, repo=mock_repo)
+    def test_get_movies_invalid_pagination(self, mock_repo):
+        for page, page_size in _INVALID_PAGINATION:
+            with pytest.raises(HTTPException):
+                get_movies(page=page, page_size=page_size, repo=mock_repo)
 
     def test_get_movies_invalid_sort_by(self, mock_repo):
         with pytest.raises(HTTPException):
@@ -85,10 +117,10 @@ class TestMoviesServiceUnit:
         mock_repo.get_popular.assert_called_once_with(limit=5)
         assert res[0].movie_id == sample_movie_out.movie_id
 
-    @pytest.mark.parametrize("limit", [0, 51])
-    def test_get_popular_movies_invalid(self, mock_repo, limit):
-        with pytest.raises(HTTPException):
-            get_popular_movies(limit=limit, repo=mock_repo)
+    def test_get_popular_movies_invalid(self, mock_repo):
+        for limit in _INVALID_LIMITS:
+            with pytest.raises(HTTPException):
+                get_popular_movies(limit=limit, repo=mock_repo)
 
     def test_get_recent_movies_valid(self, mock_repo, sample_movie_out):
         mock_repo.get_recent.return_value = [sample_movie_out]
@@ -96,10 +128,10 @@ class TestMoviesServiceUnit:
         mock_repo.get_recent.assert_called_once_with(limit=10)
         assert res[0].title == sample_movie_out.title
 
-    @pytest.mark.parametrize("limit", [0, 51])
-    def test_get_recent_movies_invalid(self, mock_repo, limit):
-        with pytest.raises(HTTPException):
-            get_recent_movies(limit=limit, repo=mock_repo)
+    def test_get_recent_movies_invalid(self, mock_repo):
+        for limit in _INVALID_LIMITS:
+            with pytest.raises(HTTPException):
+                get_recent_movies(limit=limit, repo=mock_repo)
 
     def test_search_movies_correct_call(self, mock_repo, sample_movie_out):
         mock_repo.search.return_value = ([sample_movie_out], 1)
@@ -117,37 +149,7 @@ class TestMoviesServiceUnit:
         assert res.items[0].title == sample_movie_out.title
 
     def test_get_movie_stats(self, mock_repo):
-        movie1 = MovieOut(
-            movie_id="1",
-            title="A",
-            genre="Drama, Comedy",
-            rating=10.0,
-            release_year=2000,
-            runtime=90,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        movie2 = MovieOut(
-            movie_id="2",
-            title="B",
-            genre="Drama",
-            rating=8.0,
-            release_year=2000,
-            runtime=90,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        movie3 = MovieOut(
-            movie_id="3",
-            title="C",
-            genre="Action",
-            rating=6.0,
-            release_year=2024,
-            runtime=90,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        mock_repo.get_all.side_effect = [([movie1, movie2, movie3], 3), ([], 100)]
+        mock_repo.get_all.side_effect = [(list(_STATS_MOVIES), 3), ([], 100)]
         stats = get_movie_stats(repo=mock_repo)
         assert stats["total_movies"] == 100
         assert stats["average_rating"] == 8.0
@@ -9,17 +9,22 @@ from backend.repositories.reset_tokens_repo import ResetTokenRepo
 from backend.repositories.users_repo import User, UserRepository
 from backend.services import password_reset_service as svc
 
+# Hashed once at import; every seeded user shares the same old password
+_OLD_PASSWORD_HASH = svc.hash_password("Oldpass1")
+
 
 @pytest.fixture
-def repos(mocker):
+def repos(mocker, tmp_path):
     """
     Provide fresh in-memory repos for each test and plug them into the service.
 
-    We create new UserRepository and ResetTokenRepo instances, then patch the
-    module-level _users and _tokens singletons in password_reset_service so
-    every test is isolated and does not touch real disk state.
+    The UserRepository points at a file that does not exist (so it starts
+    empty) and its save() is stubbed out, so users never touch disk. Then
+    the module-level _users and _tokens singletons in password_reset_service
+    are patched so every test is isolated.
     """
-    users = UserRepository()
+    users = UserRepository(file_path=str(tmp_path / "users.json"))
+    mocker.patch.object(users, "save")
     tokens = ResetTokenRepo()
 
     # Replace module-level singletons in the service with our fresh repos
@@ -39,7 +44,7 @@ def _seed_user(users: UserRepository) -> User:
         username="demo",
         email="user@example.com",
         password="Oldpass1",
-        passwordHash=svc.hash_password("Oldpass1"),
+        passwordHash=_OLD_PASSWORD_HASH,
         is_locked=False,
     )
     users.add_user(user)
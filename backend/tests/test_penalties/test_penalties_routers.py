@@ -1,5 +1,3 @@
-from datetime import datetime, timezone
-
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -11,15 +9,17 @@ from backend.schemas.penalties import (
     PenaltyOut,
     UserPenaltySummary,
 )
+from backend.tests.conftest import FIXED_NOW
 
 # ---------- FastAPI app & client fixtures ----------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
     """
     Create a FastAPI app instance and include the penalties' router.
     Override auth-related dependencies so that tests do not depend on real JWTs.
+    Built once per module: no test changes the routes or the overrides.
     """
     app = FastAPI()
     app.include_router(router)
@@ -39,10 +39,10 @@ def app():
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
     """
-    Provide a TestClient bound to the FastAPI app.
+    Provide a TestClient bound to the FastAPI app (shared by the module).
     """
     return TestClient(app)
 
@@ -68,15 +68,14 @@ class TestCreatePenaltyRouter:
             called["payload"] = payload
             called["is_admin"] = is_admin
 
-            now = datetime.now(timezone.utc)
             return PenaltyOut(
                 id="pen_1",
                 penalty_type=payload.penalty_type,
                 user_id=payload.user_id,
                 reason=payload.reason,
                 severity=payload.severity,
-                created_at=now,
-                updated_at=now,
+                created_at=FIXED_NOW,
+                updated_at=FIXED_NOW,
                 is_active=True,
             )
 
@@ -201,15 +200,14 @@ class TestGetPenaltyRouter:
             called["caller_user_id"] = caller_user_id
             called["is_admin"] = is_admin
 
-            now = datetime.now(timezone.utc)
             return PenaltyOut(
                 id=penalty_id,
                 penalty_type="temporary_ban",
                 user_id="target_user",
                 reason="Some reason",
                 severity=2,
-                created_at=now,
-                updated_at=now,
+                created_at=FIXED_NOW,
+                updated_at=FIXED_NOW,
                 is_active=True,
             )
 
@@ -261,15 +259,14 @@ class TestSearchPenaltiesRouter:
             called["page_size"] = page_size
             called["is_admin"] = is_admin
 
-            now = datetime.now(timezone.utc)
             penalty = PenaltyOut(
                 id="pen_1",
                 penalty_type="review_restriction",
                 user_id="user_x",
                 reason="Test search penalty",
                 severity=1,
-                created_at=now,
-                updated_at=now,
+                created_at=FIXED_NOW,
+                updated_at=FIXED_NOW,
                 is_active=True,
             )
 
@@ -128,7 +128,7 @@ def test_crud_cycle(seeded_repo):
     assert repo.get_review_by_user(movie_id, "u9").rating == 9
 
     # update
-    updated = ReviewOut(**rev.model_dump(exclude={"rating"}), rating=10)
+    updated = rev.model_copy(update={"rating": 10})
     repo.update(updated)
     assert repo.get_review_by_id(movie_id, "x9").rating == 10
 
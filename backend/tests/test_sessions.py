@@ -3,10 +3,7 @@ from __future__ import annotations
 from datetime import timedelta
 from unittest.mock import patch
 
-from fastapi.testclient import TestClient
-
 from backend import settings
-from backend.main import app
 from backend.services import auth_service as auth_svc
 from backend.services.users_service import UsersService
 
@@ -59,7 +56,7 @@ def ensure_user(username: str = "cust1", password: str = "secret2") -> None:
         )
 
 
-def test_logout_invalidates_token():
+def test_logout_invalidates_token(client):
     ensure_user()
 
     # Patch repository references used by the app routes to use our in-memory repo
@@ -67,8 +64,6 @@ def test_logout_invalidates_token():
         patch("backend.repositories.users_repo.UserRepository", new=lambda: fake_repo),
         patch("backend.routers.auth.UserRepository", new=lambda: fake_repo),
     ):
-        client = TestClient(app)
-
         r = client.post(
             "/auth/token", data={"username": "cust1", "password": "secret2"}
         )
@@ -88,15 +83,13 @@ def test_logout_invalidates_token():
         assert r4.status_code == 401
 
 
-def test_inactivity_timeout_expires_session():
+def test_inactivity_timeout_expires_session(client):
     ensure_user()
 
     with (
         patch("backend.repositories.users_repo.UserRepository", new=lambda: fake_repo),
         patch("backend.routers.auth.UserRepository", new=lambda: fake_repo),
     ):
-        client = TestClient(app)
-
         r = client.post(
             "/auth/token", data={"username": "cust1", "password": "secret2"}
         )